@@ -8,27 +8,40 @@ import pandas as pd
 global_cache = {}
 
 class Connect4:
-    def __init__(self):
-        self.board = [[' ' for _ in range(4)] for _ in range(4)]
+    def __init__(self, rows=4, cols=4, presolve=True):
+        self.rows = rows
+        self.cols = cols
+        self.board = [[' ' for _ in range(cols)] for _ in range(rows)]
         self.maxdepth = 0
         self.count = 0
         self.cache = global_cache
         self.minimax_times = []
-        self.minimax(self.startState(), True, 0)
+
+        # Every window of four cells a win can be made in
+        self.lines = []
+        for r in range(rows):
+            for c in range(cols):
+                for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                    if 0 <= r + 3 * dr < rows and 0 <= c + 3 * dc < cols:
+                        self.lines.append([(r + t * dr, c + t * dc) for t in range(4)])
+
+        # Full expansion is only practical on the default 4x4 board
+        if presolve:
+            self.minimax(self.startState(), True, 0)
 
     def startState(self):
         return (copy.deepcopy(self.board), 0)
 
     def actions(self, state):
         board, _ = state
-        return [str(i) for i in range(4) if board[0][i] == ' ']
+        return [str(i) for i in range(self.cols) if board[0][i] == ' ']
 
     def succ(self, state, action):
         board, player = state
-        boardcopy = copy.deepcopy(board)
+        boardcopy = [row[:] for row in board]
         col = int(action)
         token = 'X' if player == 1 else 'O'
-        for i in range(3, -1, -1):
+        for i in range(self.rows - 1, -1, -1):
             if boardcopy[i][col] == ' ':
                 boardcopy[i][col] = token
                 break
@@ -37,19 +50,12 @@ class Connect4:
     def isEnd(self, state):
         board, _ = state
 
-        # Horizontal and vertical
-        for i in range(4):
-            if board[i][0] == board[i][1] == board[i][2] == board[i][3] != ' ':
-                return True, True
-            if board[0][i] == board[1][i] == board[2][i] == board[3][i] != ' ':
+        # Horizontal, vertical and diagonal
+        for line in self.lines:
+            (r0, c0), (r1, c1), (r2, c2), (r3, c3) = line
+            if board[r0][c0] == board[r1][c1] == board[r2][c2] == board[r3][c3] != ' ':
                 return True, True
 
-        # Diagonal
-        if board[3][0] == board[2][1] == board[1][2] == board[0][3] != ' ':
-            return True, True
-        if board[3][3] == board[2][2] == board[1][1] == board[0][0] != ' ':
-            return True, True
-
         # Check if board is full
         for row in board:
             if ' ' in row:
@@ -66,6 +72,12 @@ class Connect4:
         board, player = state
         return (tuple(tuple(row) for row in board), player)
 
+    def state_key(self, state):
+        # A position and its mirror image have the same value
+        board, player = self.board_to_tuple(state)
+        mirrored = tuple(row[::-1] for row in board)
+        return (min(board, mirrored), player)
+
     def minimax(self, state, maximizingPlayer, depth):
         key = (self.board_to_tuple(state), maximizingPlayer)
         if key in self.cache:
@@ -106,14 +118,14 @@ class Connect4:
             if player == flip:
                 start = time.time()
                 _, action, d = self.minimax(state, flip == 0, self.count)
-                self.maxdepth = max(self.maxdepth, 16 - d)
+                self.maxdepth = max(self.maxdepth, self.rows * self.cols - d)
                 self.minimax_times.append(time.time() - start)
             else:
                 if mode == "random_vs_bot" or simulate:
                     action = random.choice(self.actions(state))
                 else:
                     print("\n".join(["| " + " | ".join(row) + " |" for row in board]))
-                    print("  " + "   ".join(map(str, range(len(board)))))
+                    print("  " + "   ".join(map(str, range(self.cols))))
                     action = None
                     valid = self.actions(state)
                     while action not in valid:
@@ -126,7 +138,7 @@ class Connect4:
         if not simulate and mode == "human_vs_bot":
             print("\nFinal board:")
             print("\n".join(["| " + " | ".join(row) + " |" for row in board]))
-            print("  " + "   ".join(map(str, range(len(board)))))
+            print("  " + "   ".join(map(str, range(self.cols))))
 
         win, ended = self.isEnd(state)
         result = {
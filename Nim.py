@@ -31,6 +31,10 @@ class Game:
         new_state[heap_index] -= remove
         return new_state
 
+    def state_key(self, state):
+        # Heap order and empty heaps do not change the position
+        return tuple(sorted(h for h in state if h))
+
     def actions(self, state):
         return self.actions_static(state)
 
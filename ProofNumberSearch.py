@@ -0,0 +1,226 @@
+import sys
+import time
+import pickle
+
+# Stands in for an infinite proof or disproof number
+INF = 10 ** 12
+# Slack on the runner-up threshold (the 1 + epsilon trick) so the search
+# stays in a subtree a little longer instead of thrashing between siblings
+EPSILON = 0.25
+
+class ProofNumberSolver:
+    """
+    Depth-first proof-number (df-pn) search over a game's actions/succ/isEnd.
+
+    Only the win/loss/draw verdict is computed, so a node is abandoned as soon
+    as one winning move (or one refutation) is proven. Entries are keyed by
+    (position, is_or): an OR entry asks "does the player to move win?", an
+    AND entry asks "does the other player win?". Both questions are root
+    independent, so a saved table can be reused for any position of the game.
+    """
+    def __init__(self, game, max_nodes=None, max_entries=1000000):
+        self.game = game
+        self.max_nodes = max_nodes
+        self.max_entries = max_entries
+        self.table = {}
+        self.nodes = 0
+
+    def state_key(self, state):
+        if hasattr(self.game, "state_key"):
+            return self.game.state_key(state)
+        return freeze(state)
+
+    def terminal(self, state):
+        """
+        Returns -1 if the player to move has lost, 0 for a draw, None if the
+        game goes on. isEnd is either a bool (the mover has lost) or an
+        (ended, won) pair where won means the previous mover made a line.
+        """
+        end = self.game.isEnd(state)
+        if isinstance(end, tuple):
+            ended, won = end
+            if not ended:
+                return None
+            return -1 if won else 0
+        return -1 if end else None
+
+    def lookup(self, state, is_or, key=None):
+        if key is None:
+            key = (self.state_key(state), is_or)
+        entry = self.table.get(key)
+        if entry is not None:
+            return entry
+
+        verdict = self.terminal(state)
+        if verdict is None:
+            # Unexpanded node: disproving an OR node (or proving an AND node)
+            # means settling every move, so start from the number of moves
+            moves = len(self.game.actions(state))
+            return (1, moves, 0) if is_or else (moves, 1, 0)
+        # The mover lost: only the AND question ("does the other player win?") holds
+        if verdict == -1 and not is_or:
+            entry = (0, INF, 0)
+        else:
+            entry = (INF, 0, 0)
+        self.table[key] = entry
+        return entry
+
+    def store(self, key, pn, dn, work):
+        self.table[key] = (pn, dn, work)
+        if len(self.table) > self.max_entries:
+            self.collect()
+
+    def collect(self):
+        """
+        Keeps memory bounded: drops half the table, solved entries and
+        entries that took the most work to compute are kept first.
+        """
+        ranked = sorted(self.table.items(), key=lambda item: (item[1][0] != 0 and item[1][1] != 0, -item[1][2]))
+        self.table = dict(ranked[:self.max_entries // 2])
+
+    def out_of_budget(self):
+        return self.max_nodes is not None and self.nodes >= self.max_nodes
+
+    def mid(self, state, is_or, th_pn, th_dn):
+        """
+        Multiple iterative deepening: expands the most proving child until
+        this node's proof or disproof number reaches its threshold.
+        """
+        pn, dn, work = self.lookup(state, is_or)
+        if pn >= th_pn or dn >= th_dn or self.out_of_budget():
+            return
+
+        key = (self.state_key(state), is_or)
+        start = self.nodes
+        self.nodes += 1
+        children = [self.game.succ(state, action) for action in self.game.actions(state)]
+        keys = [(self.state_key(child), not is_or) for child in children]
+
+        while True:
+            entries = [self.lookup(child, not is_or, child_key) for child, child_key in zip(children, keys)]
+            pns = [entry[0] for entry in entries]
+            dns = [entry[1] for entry in entries]
+            if is_or:
+                pn, dn = min(pns), min(INF, sum(dns))
+            else:
+                pn, dn = min(INF, sum(pns)), min(dns)
+            self.store(key, pn, dn, work + self.nodes - start)
+            if pn >= th_pn or dn >= th_dn or self.out_of_budget():
+                return
+
+            # Follow the child with the smallest number on the side we are
+            # trying to settle; the runner-up bounds how far we go before switching
+            ranks = pns if is_or else dns
+            order = sorted(range(len(children)), key=lambda i: ranks[i])
+            best = order[0]
+            second = ranks[order[1]] if len(order) > 1 else INF
+            second = min(INF, int(second * (1 + EPSILON)) + 1)
+            if is_or:
+                child_pn = min(th_pn, second)
+                child_dn = min(INF, th_dn - dn + dns[best])
+            else:
+                child_pn = min(INF, th_pn - pn + pns[best])
+                child_dn = min(th_dn, second)
+            self.mid(children[best], not is_or, child_pn, child_dn)
+
+    def prove(self, state, is_or):
+        self.mid(state, is_or, INF, INF)
+        return self.lookup(state, is_or)
+
+    def solve(self, state):
+        """
+        Returns (value, action) for the player to move: 1 win, 0 draw, -1 loss,
+        with a move that achieves a win or draw. value is None if the node
+        budget ran out first; calling solve again resumes from the table.
+        """
+        self.nodes = 0
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 100000))
+
+        pn, dn, _ = self.prove(state, True)
+        if pn == 0:
+            return 1, self.settled_action(state, False, 0)
+        if dn != 0:
+            return None, None
+
+        # Games whose isEnd is a bool cannot be drawn, so not winning is losing
+        if not isinstance(self.game.isEnd(state), tuple):
+            return -1, None
+
+        pn, dn, _ = self.prove(state, False)
+        if pn == 0:
+            return -1, None
+        if dn == 0:
+            return 0, self.settled_action(state, True, 1)
+        return None, None
+
+    def settled_action(self, state, is_or, index):
+        """
+        A move whose child entry has a zero proof (index 0) or disproof
+        (index 1) number, or None if it was collected from the table.
+        """
+        for action in self.game.actions(state):
+            if self.lookup(self.game.succ(state, action), is_or)[index] == 0:
+                return action
+        return None
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self.table, f)
+
+    def load(self, path):
+        with open(path, "rb") as f:
+            self.table = pickle.load(f)
+
+def freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+def build_game(args):
+    if args.game == "tictactoe":
+        from TicTacToe import Tictactoe
+        return Tictactoe(rows=args.rows, cols=args.cols, k=args.k)
+    if args.game == "connect4":
+        from ConnectFour import Connect4
+        return Connect4(rows=args.rows, cols=args.cols, presolve=False)
+    if args.game == "nim":
+        from Nim import Game
+        return Game(args.heaps)
+    from TheHalving import Game
+    return Game(args.start)
+
+# ========== CLI ENTRY ==========
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--game", choices=["tictactoe", "connect4", "nim", "halving"], required=True, help="Game to solve")
+    parser.add_argument("--rows", type=int, default=4, help="Board rows (tictactoe, connect4)")
+    parser.add_argument("--cols", type=int, default=4, help="Board columns (tictactoe, connect4)")
+    parser.add_argument("--k", type=int, default=4, help="Stones in a row needed to win (tictactoe)")
+    parser.add_argument("--heaps", type=int, nargs="+", default=[3, 4, 5], help="Heap sizes (nim)")
+    parser.add_argument("--start", type=int, default=100, help="Starting number (halving)")
+    parser.add_argument("--max-nodes", type=int, default=None, help="Node budget per run")
+    parser.add_argument("--max-entries", type=int, default=1000000, help="Table size before old entries are dropped")
+    parser.add_argument("--load", type=str, default=None, help="Resume from a saved proof table")
+    parser.add_argument("--save", type=str, default=None, help="Save the proof table when done")
+    args = parser.parse_args()
+
+    game = build_game(args)
+    solver = ProofNumberSolver(game, max_nodes=args.max_nodes, max_entries=args.max_entries)
+    if args.load:
+        solver.load(args.load)
+
+    start_time = time.time()
+    value, action = solver.solve(game.startState())
+    elapsed = time.time() - start_time
+
+    verdicts = {1: "win", 0: "draw", -1: "loss", None: "unknown (node budget reached)"}
+    print(f"[INFO] Verdict for the player to move: {verdicts[value]}")
+    if action is not None:
+        print(f"[INFO] Move: {action}")
+    print(f"[INFO] Nodes expanded: {solver.nodes}, table entries: {len(solver.table)}, time: {elapsed:.2f}s")
+
+    if args.save:
+        solver.save(args.save)
+        print(f"[INFO] Saved proof table to '{args.save}'")
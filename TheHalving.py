@@ -26,6 +26,10 @@ class Game:
     def isEnd(self, state):
         return state[0] == 0
 
+    def state_key(self, state):
+        # Positions are the same for either player to move
+        return state[0]
+
     def utility(self, state):
         if self.isEnd(state):
             return -1 if state[1] == 0 else 1
@@ -3,51 +3,156 @@ import copy
 import time
 import math
 import pandas as pd
-from functools import lru_cache
+
+# Transposition tables shared across games, one per (rows, cols, k) variant
+global_cache = {}
+
+EXACT, LOWER, UPPER = 0, 1, 2
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
 
 class Tictactoe:
-    def __init__(self, board=None):
-        self.board = board if board else [[" "]*3 for _ in range(3)]
+    def __init__(self, board=None, rows=3, cols=3, k=3):
+        if board:
+            rows, cols = len(board), len(board[0])
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.board = [cell for row in board for cell in row] if board else [" "] * (rows * cols)
         self.minimax_times = []
         self.depth = 0
+        self.nodes = 0
+
+        # Fixed seed so hashes stay valid for the shared cache across instances
+        rng = random.Random(rows * 1000 + cols)
+        self.zobrist = [(rng.getrandbits(64), rng.getrandbits(64)) for _ in range(rows * cols)]
+        self.cache = global_cache.setdefault((rows, cols, k), {})
+
+        # Board symmetries as cell permutations; one Zobrist key is kept per
+        # symmetry and the smallest one indexes the cache
+        symmetries = [
+            lambda r, c: (r, c),
+            lambda r, c: (r, cols - 1 - c),
+            lambda r, c: (rows - 1 - r, c),
+            lambda r, c: (rows - 1 - r, cols - 1 - c),
+        ]
+        if rows == cols:
+            symmetries += [
+                lambda r, c: (c, r),
+                lambda r, c: (cols - 1 - c, r),
+                lambda r, c: (c, rows - 1 - r),
+                lambda r, c: (cols - 1 - c, rows - 1 - r),
+            ]
+        self.perms = [[r * cols + c for r, c in (f(*divmod(i, cols)) for i in range(rows * cols))]
+                      for f in symmetries]
+
+        # Every k-cell window a win can be made in
+        self.lines = []
+        for r in range(rows):
+            for c in range(cols):
+                for dr, dc in DIRECTIONS:
+                    end_r, end_c = r + (k - 1) * dr, c + (k - 1) * dc
+                    if 0 <= end_r < rows and 0 <= end_c < cols:
+                        self.lines.append([(r + t * dr) * cols + c + t * dc for t in range(k)])
+        self.cell_lines = [[line for line in self.lines if i in line] for i in range(rows * cols)]
+
+        # Cells ordered from the centre outwards, tried first in the search
+        cr, cc = (rows - 1) / 2, (cols - 1) / 2
+        self.order = sorted(range(rows * cols), key=lambda i: abs(i // cols - cr) + abs(i % cols - cc))
 
     def startState(self):
-        return (copy.deepcopy(self.board), 0)
+        board = copy.copy(self.board)
+        keys = [0] * len(self.perms)
+        for i, cell in enumerate(board):
+            if cell != " ":
+                for s, perm in enumerate(self.perms):
+                    keys[s] ^= self.zobrist[perm[i]][cell == "X"]
+        return (board, 0, tuple(keys), None)
 
     def actions(self, state):
-        board, _ = state
-        acts = {}
-        for i in range(3):
-            row_actions = []
-            for j in range(3):
-                if board[i][j] == " ":
-                    row_actions.append(str(j))
-            if row_actions:
-                acts[str(i)] = row_actions
-        return acts
+        board = state[0]
+        return [i for i in self.order if board[i] == " "]
 
     def succ(self, state, action):
-        board, player = state
-        boardcopy = copy.deepcopy(board)
+        board, player, keys, _ = state
+        boardcopy = copy.copy(board)
+        boardcopy[action] = "X" if player == 1 else "O"
+        keys = tuple(key ^ self.zobrist[perm[action]][player] for key, perm in zip(keys, self.perms))
+        return (boardcopy, 1 - player, keys, action)
+
+    def state_key(self, state):
+        # Symmetry-reduced Zobrist key; the last move only matters to isEnd
+        return (min(state[2]), state[1])
+
+    def completes_line(self, board, index, symbol):
+        """
+        True if `symbol` at `index` makes k in a row. Only lines through
+        `index` are checked, so this costs O(k) rather than a board scan.
+        """
+        r, c = divmod(index, self.cols)
+        for dr, dc in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                i, j = r + sign * dr, c + sign * dc
+                while 0 <= i < self.rows and 0 <= j < self.cols and board[i * self.cols + j] == symbol:
+                    count += 1
+                    i, j = i + sign * dr, j + sign * dc
+            if count >= self.k:
+                return True
+        return False
+
+    def winning_moves(self, state, player):
+        """
+        Empty cells that complete a window already holding k-1 of `player`'s stones.
+        """
+        board = state[0]
         symbol = "X" if player == 1 else "O"
-        boardcopy[int(action[0])][int(action[1])] = symbol
-        return (boardcopy, 1 - player)
+        moves = set()
+        for line in self.lines:
+            cells = [board[i] for i in line]
+            if cells.count(symbol) == self.k - 1 and " " in cells:
+                moves.add(line[cells.index(" ")])
+        return sorted(moves)
+
+    def can_still_win(self, state, player):
+        """
+        True if some window holds none of the opponent's stones.
+        """
+        board = state[0]
+        blocker = "O" if player == 1 else "X"
+        return any(all(board[i] != blocker for i in line) for line in self.lines)
+
+    def ordered_actions(self, state):
+        """
+        Moves sorted by how much they extend the mover's open windows and cut
+        into the opponent's, so alpha-beta sees strong moves and blocks first.
+        """
+        board, player = state[0], state[1]
+        own = "X" if player == 1 else "O"
+        opp = "O" if player == 1 else "X"
+
+        def score(i):
+            total = 0
+            for line in self.cell_lines[i]:
+                cells = [board[j] for j in line]
+                if opp not in cells:
+                    total += (cells.count(own) + 1) ** 2
+                if own not in cells:
+                    total += (cells.count(opp) + 1) ** 2
+            return total
+
+        return sorted(self.actions(state), key=score, reverse=True)
 
     def isEnd(self, state):
-        board, _ = state
-        for i in range(3):
-            if board[i][0] == board[i][1] == board[i][2] != " ":
-                return (True, True)
-            if board[0][i] == board[1][i] == board[2][i] != " ":
-                return (True, True)
-        if board[0][0] == board[1][1] == board[2][2] != " ":
-            return (True, True)
-        if board[2][0] == board[1][1] == board[0][2] != " ":
+        board, player, _, last = state
+        if last is None:
+            # No move history (e.g. a preset board): check every stone
+            for i, cell in enumerate(board):
+                if cell != " " and self.completes_line(board, i, cell):
+                    return (True, True)
+        elif self.completes_line(board, last, board[last]):
             return (True, True)
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == " ":
-                    return (False, False)
+        if " " in board:
+            return (False, False)
         return (True, False)
 
     def utility(self, state):
@@ -56,20 +161,104 @@ class Tictactoe:
             return -1 if state[1] == 0 else 1
         return 0
 
-    def board_to_tuple(self, board):
-        return tuple(tuple(row) for row in board)
-
     def minimax(self, state, maximizingPlayer):
-        board_tuple = self.board_to_tuple(state[0])
-        value, action, full_depth = cached_minimax(board_tuple, state[1], maximizingPlayer, 0)
-        self.depth = full_depth
+        self.depth = 0
+        self.nodes = 0
+        value, action = self.alphabeta(state, maximizingPlayer, -2, 2, 0)
         return value, action
 
+    def alphabeta(self, state, maximizingPlayer, alpha, beta, depth):
+        """
+        Minimax with alpha-beta pruning over a Zobrist-keyed transposition
+        table. Immediate wins are taken and forced blocks are the only moves
+        searched, which cuts most of the tree on boards larger than 3x3.
+        """
+        self.nodes += 1
+        self.depth = max(self.depth, depth)
+
+        if self.isEnd(state)[0]:
+            return self.utility(state), None
+
+        win_value = 1 if maximizingPlayer else -1
+        wins = self.winning_moves(state, state[1])
+        if wins:
+            return win_value, wins[0]
+
+        threats = self.winning_moves(state, 1 - state[1])
+        if len(threats) > 1:
+            # Two open wins for the opponent: blocking one cannot save us
+            return -win_value, threats[0]
+        moves = threats if threats else self.ordered_actions(state)
+
+        # A side with no open window can at best draw
+        if not self.can_still_win(state, 0):
+            beta = min(beta, 0)
+        if not self.can_still_win(state, 1):
+            alpha = max(alpha, 0)
+        if alpha >= beta:
+            return 0, moves[0]
+
+        sym = min(range(len(self.perms)), key=lambda s: state[2][s])
+        key = (state[2][sym], maximizingPlayer)
+        entry = self.cache.get(key)
+        alpha0, beta0 = alpha, beta
+        if entry:
+            value, flag, best = entry
+            # Cached moves are stored in canonical orientation
+            best = self.perms[sym].index(best)
+            if flag == EXACT:
+                return value, best
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value, best
+            if best in moves:
+                moves = [best] + [m for m in moves if m != best]
+
+        best_action = None
+        if maximizingPlayer:
+            maxEval = -2
+            for action in moves:
+                eval, _ = self.alphabeta(self.succ(state, action), False, alpha, beta, depth + 1)
+                if eval > maxEval:
+                    maxEval = eval
+                    best_action = action
+                alpha = max(alpha, eval)
+                if alpha >= beta:
+                    break
+            best_value = maxEval
+        else:
+            minEval = 2
+            for action in moves:
+                eval, _ = self.alphabeta(self.succ(state, action), True, alpha, beta, depth + 1)
+                if eval < minEval:
+                    minEval = eval
+                    best_action = action
+                beta = min(beta, eval)
+                if alpha >= beta:
+                    break
+            best_value = minEval
+
+        if best_value <= alpha0:
+            flag = UPPER
+        elif best_value >= beta0:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.cache[key] = (best_value, flag, self.perms[sym][best_action])
+        return best_value, best_action
+
     def random_action(self, state):
-        actions = self.actions(state)
-        r = random.choice(list(actions.keys()))
-        c = random.choice(actions[r])
-        return r, c
+        return random.choice(self.actions(state))
+
+    def print_board(self, board):
+        for row in range(self.rows):
+            print("│".join(f" {cell} " for cell in board[row * self.cols:(row + 1) * self.cols]))
+            if row < self.rows - 1:
+                print("+".join(["───"] * self.cols))
+        print("\n")
 
     def play(self, mode="human_vs_bot", simulate=False):
         state = self.startState()
@@ -82,13 +271,9 @@ class Tictactoe:
             print(f"\nMinimax bot is Player {flip}\n")
 
         while not self.isEnd(state)[0]:
-            board, player = state
+            board, player = state[0], state[1]
             if not simulate:
-                for row in range(3):
-                    print("│".join(f" {cell} " for cell in board[row]))
-                    if row < 2:
-                        print("───+───+───")
-                print("\n")
+                self.print_board(board)
 
             if player == flip:
                 start_time = time.time()
@@ -96,17 +281,21 @@ class Tictactoe:
                 self.minimax_times.append(time.time() - start_time)
                 game_depths.append(self.depth)
                 if not simulate:
-                    print(f"Bot chooses: row {action[0]}, col {action[1]}")
+                    print(f"Bot chooses: row {action // self.cols}, col {action % self.cols}")
             else:
                 if mode == "random_vs_bot" or simulate:
                     action = self.random_action(state)
                 else:
                     actions = self.actions(state)
                     action = None
-                    while not action or action[0] not in actions or action[1] not in actions[action[0]]:
-                        row = input("Choose row (0-2): ").strip()
-                        col = input("Choose col (0-2): ").strip()
-                        action = (row, col)
+                    while action not in actions:
+                        try:
+                            row = int(input(f"Choose row (0-{self.rows - 1}): ").strip())
+                            col = int(input(f"Choose col (0-{self.cols - 1}): ").strip())
+                        except ValueError:
+                            continue
+                        if 0 <= row < self.rows and 0 <= col < self.cols:
+                            action = row * self.cols + col
 
             state = self.succ(state, action)
             move_count += 1
@@ -114,6 +303,7 @@ class Tictactoe:
         result = self.isEnd(state)
         win_player = 1 - state[1]
         if not simulate:
+            self.print_board(state[0])
             if result[1]:
                 print(f"\nGame over! Player {win_player} wins!")
             else:
@@ -129,48 +319,24 @@ class Tictactoe:
             "avg_minimax_time": sum(self.minimax_times) / len(self.minimax_times) if self.minimax_times else 0
         }
 
-@lru_cache(maxsize=None)
-def cached_minimax(board_tuple, player, maximizingPlayer, current_depth):
-    board = [list(row) for row in board_tuple]
-    state = (board, player)
-
-    game = Tictactoe(board)
-    if game.isEnd(state)[0]:
-        return game.utility(state), None, current_depth
-
-    best_action = None
-    if maximizingPlayer:
-        maxEval = float('-inf')
-        max_depth_reached = current_depth
-        for r in game.actions(state):
-            for c in game.actions(state)[r]:
-                next_state = game.succ(state, (r, c))
-                board_key = game.board_to_tuple(next_state[0])
-                eval, _, depth_reached = cached_minimax(board_key, next_state[1], False, current_depth + 1)
-                if eval > maxEval:
-                    maxEval = eval
-                    best_action = (r, c)
-                max_depth_reached = max(max_depth_reached, depth_reached)
-        return maxEval, best_action, max_depth_reached
-    else:
-        minEval = float('inf')
-        max_depth_reached = current_depth
-        for r in game.actions(state):
-            for c in game.actions(state)[r]:
-                next_state = game.succ(state, (r, c))
-                board_key = game.board_to_tuple(next_state[0])
-                eval, _, depth_reached = cached_minimax(board_key, next_state[1], True, current_depth + 1)
-                if eval < minEval:
-                    minEval = eval
-                    best_action = (r, c)
-                max_depth_reached = max(max_depth_reached, depth_reached)
-        return minEval, best_action, max_depth_reached
+def solve(rows=3, cols=3, k=3):
+    """
+    Solves the empty m,n,k board and reports its value for player 0
+    (1 = first player wins, 0 = draw, -1 = second player wins).
+    """
+    game = Tictactoe(rows=rows, cols=cols, k=k)
+    start_time = time.time()
+    value, action = game.minimax(game.startState(), True)
+    elapsed = time.time() - start_time
+    print(f"[INFO] {rows}x{cols}, k={k}: value {value}, best opening {action}")
+    print(f"[INFO] Nodes searched: {game.nodes}, max depth: {game.depth}, time: {elapsed:.2f}s")
+    return value, action, game.nodes, elapsed
 
-def run_loop(mode="human_vs_bot", n_games=1, output_file="tictactoe_data.csv"):
+def run_loop(mode="human_vs_bot", n_games=1, output_file="tictactoe_data.csv", rows=3, cols=3, k=3):
     all_results = []
     for i in range(n_games):
         print(f"\n======== Game {i + 1} / {n_games} ========")
-        game = Tictactoe()
+        game = Tictactoe(rows=rows, cols=cols, k=k)
         stats = game.play(mode=mode, simulate=(mode == "random_vs_bot"))
         stats["game_number"] = i + 1
         all_results.append(stats)
@@ -187,9 +353,15 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("--mode", choices=["human_vs_bot", "random_vs_bot"], required=True, help="Game mode")
+    parser.add_argument("--mode", choices=["human_vs_bot", "random_vs_bot", "solve"], required=True, help="Game mode")
     parser.add_argument("--games", type=int, default=1, help="Number of games to run")
     parser.add_argument("--output", type=str, default="tictactoe_data.csv", help="Output CSV filename")
+    parser.add_argument("--rows", type=int, default=3, help="Board rows (m)")
+    parser.add_argument("--cols", type=int, default=3, help="Board columns (n)")
+    parser.add_argument("--k", type=int, default=3, help="Stones in a row needed to win")
     args = parser.parse_args()
 
-    run_loop(mode=args.mode, n_games=args.games, output_file=args.output)
\ No newline at end of file
+    if args.mode == "solve":
+        solve(rows=args.rows, cols=args.cols, k=args.k)
+    else:
+        run_loop(mode=args.mode, n_games=args.games, output_file=args.output, rows=args.rows, cols=args.cols, k=args.k)